@@ -4,12 +4,58 @@ This module provides two utilities:
 
 * ``create_icon`` builds a folder icon with a U-turn arrow.
 * ``meme_yes_no`` displays a modal prompt asking if a file is a meme.
+
+Prompts are shown by one GUI thread that owns a hidden Tk root for the
+lifetime of the process, so the Tcl interpreter starts only once.
 """
 
+import logging
 import math
+import os
+import queue
+import sys
+import tempfile
+import threading
 import tkinter as tk
+from typing import Callable, Optional
+
 from PIL import Image, ImageDraw
+
+from autofile.notifications import APP_ID
+
+# Dialog builders waiting for the GUI thread; each receives the hidden root.
+_tk_requests: "queue.Queue[Callable[[tk.Tk], tk.Toplevel]]" = queue.Queue()
+_tk_thread: Optional[threading.Thread] = None
+_tk_thread_lock = threading.Lock()
+# Set once the GUI thread has created its root, or failed to.
+_tk_ready = threading.Event()
+_tk_error: Optional[BaseException] = None
 
+# Rendered tray icons are cached in the per-user cache folder; bump the version
+# when the drawing changes.
+ICON_CACHE_VERSION = 1
+
+
+def _icon_cache_dir() -> str:
+    """Return the per-user folder the tray icon is cached in.
+
+    Returns:
+        str: An ``AutoSort`` folder under ``%LOCALAPPDATA%`` on Windows,
+        ``~/Library/Caches`` on macOS and ``$XDG_CACHE_HOME`` (``~/.cache``
+        by default) elsewhere.
+
+    Side Effects:
+        Reads the environment.
+    """
+    home = os.path.expanduser("~")
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(home, "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(home, "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(home, ".cache")
+    return os.path.join(base, APP_ID)
+
 
 def create_icon(width: int = 64, height: int = 64) -> Image.Image:
     """Generate a folder icon with a U-turn arrow.
@@ -22,8 +68,22 @@ def create_icon(width: int = 64, height: int = 64) -> Image.Image:
         Image.Image: The generated icon.
 
     Side Effects:
-        None.
+        Reads the icon from, or writes it to, a PNG in ``_icon_cache_dir()``,
+        creating the folder if needed, so later starts skip the drawing. The
+        PNG is written to a temporary file and renamed into place, so a reader
+        never sees half of it.
     """
+    cache_dir = _icon_cache_dir()
+    cache_path = os.path.join(
+        cache_dir, f"autofilesort_icon_v{ICON_CACHE_VERSION}_{width}x{height}.png"
+    )
+    try:
+        cached = Image.open(cache_path)
+        cached.load()
+        return cached
+    except OSError:
+        pass  # Not cached yet (or unreadable); draw it below.
+
     # Create a blank image with a white background.
     image = Image.new("RGB", (width, height), "white")
     draw = ImageDraw.Draw(image)
@@ -68,22 +128,98 @@ def create_icon(width: int = 64, height: int = 64) -> Image.Image:
     arrow_head = [p1, p2, p3]
 
     draw.polygon(arrow_head, fill="black")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix=".png", dir=cache_dir)
+    except OSError:
+        # Caching is optional; an unwritable folder just means redrawing.
+        logging.debug("Could not cache the tray icon", exc_info=True)
+        return image
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            image.save(tmp_file, "PNG")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logging.debug("Could not cache the tray icon", exc_info=True)
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
     return image
 
 
-def meme_yes_no() -> bool:
-    """Display a modal prompt asking whether a file is a meme.
+def _tk_worker() -> None:
+    """Own the hidden Tk root and show queued dialogs one at a time.
 
     Returns:
-        bool: ``True`` if "Yes" is clicked and ``False`` otherwise.
+        None.
 
     Side Effects:
-        Creates and destroys a Tkinter window and blocks until the user responds.
+        Creates the Tk root; runs forever on a daemon thread.
     """
-    is_meme = False  # Default value
+    global _tk_error
+    try:
+        tk_root = tk.Tk()
+    except BaseException as error:  # no display available
+        _tk_error = error
+        _tk_ready.set()
+        return
+    tk_root.withdraw()
+    _tk_ready.set()
+    while True:
+        build = _tk_requests.get()
+        try:
+            tk_root.wait_window(build(tk_root))
+        except tk.TclError:  # pragma: no cover
+            # The dialog was destroyed before or while waiting on it.
+            logging.debug("Dialog ended with a Tcl error", exc_info=True)
+        except Exception:  # pragma: no cover
+            # Keep the GUI thread alive for the next prompt.
+            logging.error("Failed to show dialog", exc_info=True)
 
-    # Create the main window
-    root = tk.Tk()
+
+def _show_dialog(build: Callable[[tk.Tk], tk.Toplevel]) -> None:
+    """Queue a dialog for the GUI thread, starting the thread if needed.
+
+    Args:
+        build: Creates the dialog as a child of the hidden root and returns it.
+
+    Returns:
+        None.
+
+    Raises:
+        tkinter.TclError: If the Tk root could not be created.
+
+    Side Effects:
+        May start the GUI thread.
+    """
+    global _tk_thread, _tk_error
+    with _tk_thread_lock:
+        if _tk_thread is None or not _tk_thread.is_alive():
+            _tk_ready.clear()
+            _tk_error = None
+            _tk_thread = threading.Thread(
+                target=_tk_worker, name="autosort-gui", daemon=True
+            )
+            _tk_thread.start()
+        _tk_ready.wait()
+        if _tk_error is not None:
+            raise _tk_error
+    _tk_requests.put(build)
+
+
+def _build_meme_prompt(tk_root: tk.Tk, reply: Callable[[bool], None]) -> tk.Toplevel:
+    """Create the "Meme?" dialog.
+
+    Args:
+        tk_root: Hidden root window owned by the GUI thread.
+        reply: Called with the user's answer before the dialog closes.
+
+    Returns:
+        tk.Toplevel: The dialog window.
+    """
+    # Create the dialog window
+    root = tk.Toplevel(tk_root)
     root.overrideredirect(True)  # Remove the title bar and window borders
     root.configure(bg="#2e2e2e")  # "#2e2e2e" = dark grey background
 
@@ -114,10 +250,9 @@ def meme_yes_no() -> bool:
         """Mark selection as a meme and close the prompt.
 
         Side Effects:
-            Updates ``is_meme`` and destroys the window.
+            Reports ``True`` and destroys the window.
         """
-        nonlocal is_meme
-        is_meme = True
+        reply(True)
         root.destroy()
 
     # "No" button --> set is_meme to False and close the window.
@@ -125,10 +260,9 @@ def meme_yes_no() -> bool:
         """Mark selection as not a meme and close the prompt.
 
         Side Effects:
-            Updates ``is_meme`` and destroys the window.
+            Reports ``False`` and destroys the window.
         """
-        nonlocal is_meme
-        is_meme = False
+        reply(False)
         root.destroy()
 
     # "Yes" button color scheme/formatting
@@ -165,7 +299,34 @@ def meme_yes_no() -> bool:
     root.focus_force()  # Force the window to take focus
     root.grab_set()  # Make the window modal so all events are directed to it
 
-    root.mainloop()
+    return root
 
-    # Return the result of the user's choice
-    return is_meme
+
+def meme_yes_no() -> bool:
+    """Display a modal prompt asking whether a file is a meme.
+
+    Returns:
+        bool: ``True`` if "Yes" is clicked and ``False`` otherwise.
+
+    Side Effects:
+        Shows a dialog on the GUI thread and blocks until the user responds.
+    """
+    answer: list[bool] = [False]  # Default value
+    answered = threading.Event()
+
+    def reply(is_meme: bool) -> None:
+        answer[0] = is_meme
+
+    def build(tk_root: tk.Tk) -> tk.Toplevel:
+        try:
+            dialog = _build_meme_prompt(tk_root, reply)
+        except BaseException:
+            answered.set()
+            raise
+        # Also wakes the caller if the dialog is closed some other way.
+        dialog.bind("<Destroy>", lambda event: answered.set(), add="+")
+        return dialog
+
+    _show_dialog(build)
+    answered.wait()
+    return answer[0]
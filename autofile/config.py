@@ -6,6 +6,7 @@ import copy
 import json
 import logging
 import os
+import sys
 from pathlib import Path
 
 # Default mapping between categories and file extensions.
@@ -80,7 +81,8 @@ def _normalize_extensions(items: list[str]) -> list[str]:
         items: Raw extension strings that may lack a leading dot or use mixed case.
 
     Returns:
-        list[str]: Normalized extensions in lower case starting with a dot.
+        list[str]: Normalized, interned extensions in lower case starting with
+        a dot.
 
     Side Effects:
         None.
@@ -92,19 +94,22 @@ def _normalize_extensions(items: list[str]) -> list[str]:
             continue
         if not ext.startswith("."):
             ext = "." + ext
-        normalized.append(ext)
+        # Interned so lookup tables share one object per extension
+        normalized.append(sys.intern(ext))
     return normalized
 
 
-def load_config(config_file_path: Path) -> tuple[dict[str, list[str]], set[str]]:
+def load_config(
+    config_file_path: Path,
+) -> tuple[dict[str, list[str]], frozenset[str]]:
     """Load categories and skip extensions from a JSON configuration file.
 
     Args:
         config_file_path: Location of the configuration file.
 
     Returns:
-        tuple[dict[str, list[str]], set[str]]: Mapping of categories to extensions and
-        a set of extensions that should be ignored.
+        tuple[dict[str, list[str]], frozenset[str]]: Mapping of categories to
+        extensions and the extensions that should be ignored.
 
     Side Effects:
         Reads the configuration from disk and logs warnings on failure.
@@ -116,7 +121,7 @@ def load_config(config_file_path: Path) -> tuple[dict[str, list[str]], set[str]]
             raise ValueError("Config root must be a JSON object.")
 
         skip_list = data.get("SkipExtensions", DEFAULT_SKIP_EXTENSIONS)
-        skip_extensions = set(_normalize_extensions(skip_list))
+        skip_extensions = frozenset(_normalize_extensions(skip_list))
 
         reserved = {"SkipExtensions", "_meta"}
         categories: dict[str, list[str]] = {}
@@ -136,37 +141,93 @@ def load_config(config_file_path: Path) -> tuple[dict[str, list[str]], set[str]]
             config_file_path,
             error,
         )
-        return copy.deepcopy(DEFAULT_FILE_TYPES), set(
+        return copy.deepcopy(DEFAULT_FILE_TYPES), frozenset(
             _normalize_extensions(DEFAULT_SKIP_EXTENSIONS)
         )
 
 
+def _env_seconds(name: str, default: float) -> float:
+    """Read a positive number of seconds from an environment variable.
+
+    Args:
+        name: Environment variable to read.
+        default: Value used when the variable is unset or invalid.
+
+    Returns:
+        float: The configured number of seconds.
+
+    Side Effects:
+        Logs a warning when the variable cannot be parsed.
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        logging.warning("Ignoring invalid %s=%r, using %s", name, raw, default)
+        return default
+    return value if value > 0 else default
+
+
+def build_extension_map(categories: dict[str, list[str]]) -> dict[str, str]:
+    """Invert the category mapping into a flat extension lookup.
+
+    Args:
+        categories: Mapping of category names to their extensions.
+
+    Returns:
+        dict[str, str]: Category of every configured extension. When an
+        extension is listed under several categories the first one wins.
+
+    Side Effects:
+        None.
+    """
+    ext_to_category: dict[str, str] = {}
+    for category, extensions in categories.items():
+        for ext in extensions:
+            ext_to_category.setdefault(ext, category)
+    return ext_to_category
+
+
 CONFIG_FILE_PATH = Path(__file__).resolve().parents[1] / "config" / "file_types.json"
 
 # Load categories and skip rules
 file_types, SKIP_EXTENSIONS = load_config(CONFIG_FILE_PATH)
 
+# Resolve the home directory once; expanduser re-reads the environment
+_HOME = os.path.expanduser("~")
+_DESKTOP = os.path.join(_HOME, "Desktop")
+
 # Folder paths used by the sorter
 FOLDER_PATHS = {
-    "Downloads": os.path.join(os.path.expanduser("~"), "Downloads"),
-    "Media": os.path.join(os.path.expanduser("~"), "Desktop", "Media"),
-    "Memes": os.path.join(os.path.expanduser("~"), "Desktop", "Media", "Memes"),
-    "Docs": os.path.join(os.path.expanduser("~"), "Desktop", "Docs"),
-    "Archives": os.path.join(os.path.expanduser("~"), "Desktop", "Archives"),
-    "Programs": os.path.join(os.path.expanduser("~"), "Desktop", "Programs"),
-    "Development": os.path.join(os.path.expanduser("~"), "Desktop", "Development"),
+    "Downloads": os.path.join(_HOME, "Downloads"),
+    "Media": os.path.join(_DESKTOP, "Media"),
+    "Memes": os.path.join(_DESKTOP, "Media", "Memes"),
+    "Docs": os.path.join(_DESKTOP, "Docs"),
+    "Archives": os.path.join(_DESKTOP, "Archives"),
+    "Programs": os.path.join(_DESKTOP, "Programs"),
+    "Development": os.path.join(_DESKTOP, "Development"),
 }
 
 # Ensure every category from the configuration has a destination folder
 for category_name in file_types:
     FOLDER_PATHS.setdefault(
         category_name,
-        os.path.join(os.path.expanduser("~"), "Desktop", category_name),
+        os.path.join(_DESKTOP, category_name),
     )
 
 # Normalize folder paths
 PATH_TO_FOLDERS = {key: os.path.normpath(value) for key, value in FOLDER_PATHS.items()}
 for path in PATH_TO_FOLDERS.values():
-    os.makedirs(path, exist_ok=True)
+    # isdir is one cheap attribute lookup; mkdir on an existing folder is not
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
 
 DOWNLOADS_FOLDER_PATH = PATH_TO_FOLDERS["Downloads"]
+
+# Seconds between directory snapshots when Downloads lives on a network share
+POLL_INTERVAL_SECONDS = _env_seconds("AUTOSORT_POLL_INTERVAL", 30.0)
+
+# One dict probe per file instead of scanning every category's list
+EXT_TO_CATEGORY = build_extension_map(file_types)
@@ -1,27 +1,146 @@
-"""Notification utilities for AutoSort."""
+"""Notification utilities for AutoSort.
+
+``win11toast`` is imported on the first notification rather than at import
+time, so the tray can start before the WinRT toast stack is loaded.
+"""
 
 from __future__ import annotations
 
 import logging
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 APP_ID = "AutoSort"
 
-try:  # pragma: no cover
-    from win11toast import (
-        notify as win_notify,
-        toast as win_toast,
-        update_progress as win_update_progress,
-    )
-except Exception:  # pragma: no cover
-    win_notify = None
-    win_toast = None
-    win_update_progress = None
+# Bound by _load_win11toast() on first use.
+win_notify: Any = None
+win_toast: Any = None
+win_update_progress: Any = None
+_win11toast_loaded = False
+_win11toast_lock = threading.Lock()
+
+# Toasts are shown one after another by a single long-lived worker thread;
+# win11toast's toast() blocks until the toast is dismissed.
+_toast_q: queue.Queue[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = (
+    queue.Queue()
+)
+_toast_thread: Optional[threading.Thread] = None
+_toast_thread_lock = threading.Lock()
+
+
+def _load_win11toast() -> bool:
+    """Import ``win11toast`` the first time a notification is shown.
+
+    Returns:
+        bool: ``True`` if the toast functions are available.
+
+    Side Effects:
+        Binds ``win_notify``, ``win_toast`` and ``win_update_progress`` under
+        ``_win11toast_lock``, so concurrent callers wait for one import.
+    """
+    global win_notify, win_toast, win_update_progress, _win11toast_loaded
+    if not _win11toast_loaded:
+        with _win11toast_lock:
+            if not _win11toast_loaded:
+                try:  # pragma: no cover
+                    from win11toast import notify, toast, update_progress
+
+                    win_notify, win_toast, win_update_progress = (
+                        notify,
+                        toast,
+                        update_progress,
+                    )
+                except Exception:  # pragma: no cover
+                    pass
+                _win11toast_loaded = True
+    return win_toast is not None
+
+
+def _toast_worker() -> None:
+    """Show queued toasts forever.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Calls the queued toast functions; meant to run on a daemon thread.
+    """
+    while True:
+        fn, args, kwargs = _toast_q.get()
+        try:
+            fn(*args, **kwargs)
+        except Exception as err:  # pragma: no cover
+            logging.error("show_notification failed: %s", err, exc_info=True)
+
+
+def _enqueue_toast(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """Queue a toast call for the toast worker thread.
+
+    Args:
+        fn: Toast function to call.
+        *args: Positional arguments for ``fn``.
+        **kwargs: Keyword arguments for ``fn``.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Starts the toast worker thread on first use.
+    """
+    global _toast_thread
+    with _toast_thread_lock:
+        if _toast_thread is None:
+            _toast_thread = threading.Thread(
+                target=_toast_worker, name="autosort-toast", daemon=True
+            )
+            _toast_thread.start()
+    _toast_q.put((fn, args, kwargs))
+
+
+def _select_in_explorer(path: str) -> bool:
+    """Reveal a file in Explorer without spawning a process.
+
+    Args:
+        path: Absolute, normalized path to highlight.
+
+    Returns:
+        bool: ``True`` if ``SHOpenFolderAndSelectItems`` succeeded.
+
+    Side Effects:
+        Opens an Explorer window; no effect on other platforms.
+    """
+    if not sys.platform.startswith("win"):
+        return False
+    import ctypes
+
+    shell32 = ctypes.windll.shell32
+    ole32 = ctypes.windll.ole32
+    shell32.ILCreateFromPathW.argtypes = [ctypes.c_wchar_p]
+    shell32.ILCreateFromPathW.restype = ctypes.c_void_p
+    shell32.SHOpenFolderAndSelectItems.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_uint,
+        ctypes.c_void_p,
+        ctypes.c_ulong,
+    ]
+    shell32.ILFree.argtypes = [ctypes.c_void_p]
+
+    pidl = shell32.ILCreateFromPathW(path)
+    if not pidl:
+        return False
+    hr_init = ole32.CoInitialize(None)
+    try:
+        return bool(shell32.SHOpenFolderAndSelectItems(pidl, 0, None, 0) == 0)
+    finally:
+        shell32.ILFree(pidl)
+        if hr_init >= 0:
+            ole32.CoUninitialize()
 
 
 def open_file_location(file_path: str) -> None:
@@ -39,8 +158,8 @@ def open_file_location(file_path: str) -> None:
     normalized_path = os.path.normpath(os.path.abspath(file_path))
     try:
         if sys.platform.startswith("win"):
-            cmd = f'explorer /select,"{normalized_path}"'
-            subprocess.run(cmd, shell=True, check=False)
+            if not _select_in_explorer(normalized_path):
+                subprocess.run(["explorer", f"/select,{normalized_path}"], check=False)
         elif sys.platform == "darwin":
             subprocess.run(["open", "-R", normalized_path], check=False)
         else:
@@ -71,9 +190,10 @@ def show_notification(
         None.
 
     Side Effects:
-        Displays a notification or prints to stdout depending on the platform.
+        Queues a toast for the toast worker or prints to stdout depending on
+        the platform.
     """
-    if not sys.platform.startswith("win") or win_toast is None:
+    if not sys.platform.startswith("win") or not _load_win11toast():
         logging.info("%s %s", title, message)
         print(title, message)
         return
@@ -89,17 +209,15 @@ def show_notification(
         elif open_folder:
             open_file_location(open_folder)
 
-    try:
-        win_toast(
-            APP_ID,
-            message,
-            icon=str(Path(__file__).resolve().parents[1] / "exe_icon.ico"),
-            #on_click=callback if select_file or open_folder else None,
-            app_id=APP_ID,
-            **toast_kwargs,
-        )
-    except Exception as err:  # pragma: no cover
-        logging.error("show_notification failed: %s", err, exc_info=True)
+    _enqueue_toast(
+        win_toast,
+        APP_ID,
+        message,
+        icon=str(Path(__file__).resolve().parents[1] / "exe_icon.ico"),
+        #on_click=callback if select_file or open_folder else None,
+        app_id=APP_ID,
+        **toast_kwargs,
+    )
 
 
 def progress_begin(initial_status: str, total: int) -> None:
@@ -115,7 +233,7 @@ def progress_begin(initial_status: str, total: int) -> None:
     Side Effects:
         Displays a progress toast or logs to stdout.
     """
-    if not sys.platform.startswith("win") or win_notify is None:
+    if not sys.platform.startswith("win") or not _load_win11toast():
         logging.info("[Progress] %s 0/%d", initial_status, total)
         print(f"[Progress] {initial_status} 0/{total}")
         return
@@ -152,7 +270,7 @@ def progress_update(done: int, total: int, status: str | None = None) -> None:
         Updates the displayed toast or console output.
     """
     ratio = 0.0 if total <= 0 else max(0.0, min(1.0, done / total))
-    if not sys.platform.startswith("win") or win_update_progress is None:
+    if not sys.platform.startswith("win") or not _load_win11toast():
         msg = f"[Progress] {status or 'Working...'} {done}/{total} ({int(ratio*100)}%)"
         logging.info(msg)
         print(msg)
@@ -188,7 +306,7 @@ def progress_complete(message: str = "Completed!") -> None:
     Side Effects:
         Updates the toast notification or prints to stdout.
     """
-    if not sys.platform.startswith("win") or win_update_progress is None:
+    if not sys.platform.startswith("win") or not _load_win11toast():
         logging.info("[Progress] %s", message)
         print(f"[Progress] {message}")
         return
@@ -1,21 +1,29 @@
-"""File sorting routines for AutoSort."""
+"""File sorting routines for AutoSort.
+
+``auto_gui`` (Tkinter and Pillow) is only imported when a meme prompt is
+actually needed.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
+import errno
 import logging
+import logging.handlers
 import os
+import queue
 import shutil
+import sys
+import threading
 import time
 from typing import Optional
 from pathlib import Path
 
-import auto_gui
-
 from .config import (
     DOWNLOADS_FOLDER_PATH,
+    EXT_TO_CATEGORY,
     PATH_TO_FOLDERS,
     SKIP_EXTENSIONS,
-    file_types,
 )
 from .notifications import (
     progress_begin,
@@ -26,40 +34,179 @@ from .notifications import (
 
 meme_enabled: bool = True
 
+# A meme prompt answer is reused for media files arriving within this window,
+# so a burst of images asks once instead of once per file.
+MEME_ANSWER_TTL_SECONDS: float = 10.0
+_last_meme_answer: Optional[tuple[float, bool]] = None
+
+# Moves are I/O bound, so a scan moves several files at once.
+_move_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 4), thread_name_prefix="mover"
+)
+# Guards the shared ``listings`` sets while a move reserves its final name.
+_names_lock = threading.Lock()
+# Held for a whole ``sort_files`` scan; an overlapping call returns at once.
+_scan_lock = threading.Lock()
+
+# Set AUTOSORT_DEBUG=1 to also write debug records to the log file.
+DEBUG: bool = os.environ.get("AUTOSORT_DEBUG") == "1"
+
 log_file_path = os.path.join(PATH_TO_FOLDERS["Development"], "AutoSort.log")
+
+
+def _configure_logging(
+    path: str, log_queue: queue.Queue[logging.LogRecord]
+) -> logging.handlers.QueueListener:
+    """Send log records to ``path`` from a background thread.
+
+    Loggers only enqueue records; a ``QueueListener`` owns the file handler, so
+    a burst of moves never waits on disk writes. Records are buffered in a
+    ``MemoryHandler`` and written once per sort via ``flush_logs``; errors are
+    written immediately.
+
+    Args:
+        path: Log file location.
+        log_queue: Queue connecting the root logger to the listener.
+
+    Returns:
+        logging.handlers.QueueListener: The started listener.
+
+    Side Effects:
+        Attaches a ``QueueHandler`` to the root logger and starts a thread.
+    """
+    file_handler = logging.FileHandler(path, encoding="utf-8", delay=True)
+    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.ERROR, target=file_handler
+    )
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+    listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
 # Logging to record file movements and any errors that might occur.
-logging.basicConfig(
-    filename=log_file_path,
-    level=logging.INFO,
-    format="%(asctime)s - %(message)s",
-)
+_log_queue: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+log_listener = _configure_logging(log_file_path, _log_queue)
+_log_listener_running = True
+
+
+def flush_logs() -> None:
+    """Write buffered log records to the log file.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Waits for the logging thread to drain its queue, then flushes the
+        buffered records to disk.
+    """
+    if _log_listener_running:
+        _log_queue.join()
+    for handler in log_listener.handlers:
+        handler.flush()
+
+
+def stop_logging() -> None:
+    """Write out queued log records and stop the logging thread.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Joins the listener thread and flushes buffered records; later records
+        are no longer written.
+    """
+    global _log_listener_running
+    if _log_listener_running:
+        _log_listener_running = False
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.flush()
+
+
+def _taken_names(folder: str) -> set[str]:
+    """List a folder's entries in the form ``check_name`` compares them.
+
+    Args:
+        folder: Folder to list.
+
+    Returns:
+        set[str]: Case-folded names of the folder's entries.
+
+    Side Effects:
+        Lists ``folder``, creating it if it was removed after startup.
+    """
+    try:
+        names = os.listdir(folder)
+    except FileNotFoundError:
+        os.makedirs(folder, exist_ok=True)
+        return set()
+    return {name.casefold() for name in names}
 
 
-def check_name(dest_folder: str, entry_name: str) -> str:
+def check_name(
+    dest_folder: str, entry_name: str, taken: Optional[set[str]] = None
+) -> str:
     """Return a destination path that avoids name collisions.
 
+    Candidate names are checked against a single listing of the folder instead
+    of one ``os.path.exists`` call per candidate. Names are compared
+    case-insensitively so the result is also safe on NTFS and APFS.
+
     Args:
         dest_folder: Folder where the file will be placed.
         entry_name: Original file name.
+        taken: Case-folded names already present in ``dest_folder``, shared by
+            callers that place several files in one pass. The chosen name is
+            added to it. Listed from disk when omitted.
 
     Returns:
         str: A destination path that does not overwrite existing files.
 
     Side Effects:
-        None.
+        Lists (and if needed creates) ``dest_folder`` when ``taken`` is not
+        given; updates ``taken``.
     """
-    file_name, extension = os.path.splitext(entry_name)
-    destination_path_name = os.path.join(dest_folder, entry_name)
-    if os.path.exists(destination_path_name):
+    if taken is None:
+        taken = _taken_names(dest_folder)
+    final_name = entry_name
+    if entry_name.casefold() in taken:
+        file_name, extension = os.path.splitext(entry_name)
+        # casefold maps characters independently, so the fixed parts of the
+        # candidate are folded once instead of on every attempt.
+        prefix = f"{file_name}_(".casefold()
+        suffix = f"){extension}".casefold()
         counter = 1
-        while os.path.exists(
-            os.path.join(dest_folder, f"{file_name}_{'('+str(counter)+')'}{extension}")
-        ):
+        while prefix + str(counter) + suffix in taken:
             counter += 1
-        return os.path.join(
-            dest_folder, f"{file_name}_{'('+str(counter)+')'}{extension}"
-        )
-    return destination_path_name
+        final_name = f"{file_name}_({counter}){extension}"
+    taken.add(final_name.casefold())
+    return os.path.join(dest_folder, final_name)
+
+
+def _ext_of(name: str) -> str:
+    """Return a file name's lower-case extension, including the dot.
+
+    Only the last dot counts and a leading dot does not start an extension;
+    this is cheaper than ``os.path.splitext`` on the scan's hot path.
+
+    Args:
+        name: File name, or a path whose last component is the file name.
+
+    Returns:
+        str: The extension such as ``".pdf"``, or ``""`` if there is none.
+
+    Side Effects:
+        None.
+    """
+    lower_name = os.path.basename(name).lower()
+    i = lower_name.rfind(".")
+    return lower_name[i:] if i > 0 else ""
 
 
 def should_skip_by_extension(filename: str) -> bool:
@@ -74,39 +221,348 @@ def should_skip_by_extension(filename: str) -> bool:
     Side Effects:
         None.
     """
-    _, ext = os.path.splitext(filename.lower())
-    return ext in SKIP_EXTENSIONS
+    ext = _ext_of(filename)
+    return bool(ext) and ext in SKIP_EXTENSIONS
 
 
 def is_file_fully_downloaded(
-    file_path: str, wait_time: int = 1, check_interval: int = 1
+    file_path: str,
+    initial_size: Optional[int] = None,
+    wait_time: float = 1.0,
+    min_interval: float = 0.1,
+    max_interval: float = 2.0,
 ) -> bool:
-    """Wait until a file's size stabilizes.
+    """Wait until a file's size and modification time stop changing.
+
+    The delay between checks starts at ``min_interval`` and doubles while the
+    file stays unchanged, so a finished file is confirmed with a handful of
+    ``stat`` calls instead of one wake-up per second.
 
     Args:
         file_path: Path to the file being monitored.
-        wait_time: Seconds that the size must remain constant.
-        check_interval: Delay between size checks in seconds.
+        initial_size: Size already known to the caller (e.g. from a cached
+            ``os.DirEntry.stat()``); used in place of the first size read.
+        wait_time: Seconds that the file must remain unchanged.
+        min_interval: First delay between checks in seconds.
+        max_interval: Upper bound for the delay between checks in seconds.
 
     Returns:
-        bool: ``True`` when the file size stops changing.
+        bool: ``True`` when the file is stable, ``False`` if it disappeared.
 
     Side Effects:
-        Reads the file size repeatedly and sleeps between checks.
+        Stats the file repeatedly and sleeps between checks.
     """
-    prev_size = -1
-    stable_count = 0
-    while stable_count < wait_time:
-        current_size = os.path.getsize(file_path)
-        if current_size == prev_size:
-            stable_count += check_interval
+    prev_size = initial_size
+    prev_mtime: Optional[int] = None
+    interval = min_interval
+    stable_for = 0.0
+    while stable_for < wait_time:
+        time.sleep(interval)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return False
+        same_mtime = prev_mtime is None or st.st_mtime_ns == prev_mtime
+        if st.st_size == prev_size and same_mtime:
+            stable_for += interval
+            interval = min(interval * 2, max_interval)
         else:
-            stable_count = 0
-        prev_size = current_size
-        time.sleep(check_interval)
+            stable_for = 0.0
+            interval = min_interval
+        prev_size, prev_mtime = st.st_size, st.st_mtime_ns
     return True
 
 
+# Destination folders on a different filesystem than Downloads, learned from
+# the first rename that failed with EXDEV so later moves skip the attempt.
+_cross_device_folders: set[str] = set()
+
+
+# ioctl request from <linux/fs.h> that shares a file's extents (reflink).
+FICLONE = 0x40049409
+
+# Errors meaning "this copy mechanism is unavailable here, try the next".
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.ENOTTY}
+)
+
+# Errors meaning the filesystem cannot hard-link this file (FAT, some network
+# shares, protected_hardlinks), as opposed to the target already existing.
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EPERM, errno.EACCES, errno.ENOSYS, errno.EOPNOTSUPP, errno.EMLINK}
+)
+
+# CopyFile2/CopyFileExW flag that makes the copy fail if the target exists.
+COPY_FILE_FAIL_IF_EXISTS = 0x1
+
+
+def _rename_no_replace(src: str, dst: str) -> None:
+    """Rename a file without ever replacing an existing ``dst``.
+
+    POSIX ``rename`` silently replaces its target, so elsewhere the file is
+    hard-linked to its new name (``link`` refuses an existing target) and the
+    old name removed. Windows ``rename`` already refuses to replace.
+
+    Args:
+        src: File to rename.
+        dst: New path of the file.
+
+    Returns:
+        None.
+
+    Raises:
+        FileExistsError: If ``dst`` already exists.
+        OSError: ``EXDEV`` if ``dst`` is on another filesystem.
+
+    Side Effects:
+        Renames ``src``.
+    """
+    if sys.platform.startswith("win"):
+        os.rename(src, dst)
+        return
+    try:
+        os.link(src, dst)
+    except OSError as err:
+        if err.errno not in _LINK_UNSUPPORTED_ERRNOS:
+            raise
+        # No hard links here; checking first leaves only a narrow race.
+        if os.path.lexists(dst):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+        os.rename(src, dst)
+        return
+    try:
+        os.unlink(src)
+    except BaseException:
+        os.unlink(dst)
+        raise
+
+
+def _linux_copy_fds(in_fd: int, out_fd: int) -> None:
+    """Copy an open file inside the kernel, cheapest mechanism first.
+
+    Tries a reflink clone (instant on Btrfs/XFS, including across Btrfs
+    subvolumes where ``rename`` reports ``EXDEV``), then ``copy_file_range``
+    and finally ``sendfile``.
+
+    Args:
+        in_fd: Descriptor of the source, positioned at offset 0.
+        out_fd: Descriptor of the empty destination.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Writes the destination file.
+    """
+    import fcntl
+
+    try:
+        fcntl.ioctl(out_fd, FICLONE, in_fd)
+        return
+    except OSError as err:
+        if err.errno not in _COPY_FALLBACK_ERRNOS:
+            raise
+    if hasattr(os, "copy_file_range"):
+        try:
+            while os.copy_file_range(in_fd, out_fd, 1 << 30):
+                pass
+            return
+        except OSError as err:
+            # Only safe to switch mechanisms before anything was written.
+            if err.errno not in _COPY_FALLBACK_ERRNOS or os.lseek(out_fd, 0, 1):
+                raise
+    while os.sendfile(out_fd, in_fd, None, 1 << 20):
+        pass
+
+
+def _windows_copy_file(src: str, dst: str) -> None:
+    """Copy a file with the native Windows copy engine.
+
+    ``CopyFile2`` (Windows 8+) lets SMB shares perform the copy server-side;
+    ``CopyFileExW`` is used where it is unavailable.
+
+    Args:
+        src: File to read from.
+        dst: File to create; must not exist yet.
+
+    Returns:
+        None.
+
+    Raises:
+        FileExistsError: If ``dst`` already exists.
+
+    Side Effects:
+        Writes ``dst``.
+    """
+    if not sys.platform.startswith("win"):
+        shutil.copyfile(src, dst)
+        return
+    import ctypes
+
+    class _CopyFile2ExtendedParameters(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", ctypes.c_uint32),
+            ("dwCopyFlags", ctypes.c_uint32),
+            ("pfCancel", ctypes.c_void_p),
+            ("pProgressRoutine", ctypes.c_void_p),
+            ("pvCallbackContext", ctypes.c_void_p),
+        ]
+
+    kernel32 = ctypes.windll.kernel32
+    copy_file2 = getattr(kernel32, "CopyFile2", None)
+    if copy_file2 is not None:
+        params = _CopyFile2ExtendedParameters(
+            ctypes.sizeof(_CopyFile2ExtendedParameters), COPY_FILE_FAIL_IF_EXISTS
+        )
+        copy_file2.restype = ctypes.c_long
+        hresult = copy_file2(src, dst, ctypes.byref(params))
+        if hresult < 0:
+            # HRESULT_FROM_WIN32 keeps the Win32 error code in the low word.
+            raise ctypes.WinError(hresult & 0xFFFF)
+        return
+    if not kernel32.CopyFileExW(src, dst, None, None, None, COPY_FILE_FAIL_IF_EXISTS):
+        raise ctypes.WinError()
+
+
+def _copy_file_contents(src: str, dst: str) -> None:
+    """Copy a file's bytes without routing them through Python buffers.
+
+    Args:
+        src: File to read from.
+        dst: File to create; must not exist yet.
+
+    Returns:
+        None.
+
+    Raises:
+        FileExistsError: If ``dst`` already exists; nothing is written then.
+
+    Side Effects:
+        Writes ``dst`` using ``_windows_copy_file`` on Windows,
+        ``_linux_copy_fds`` on Linux and ``shutil.copyfile`` elsewhere.
+    """
+    if sys.platform.startswith("win"):
+        _windows_copy_file(src, dst)
+        return
+    if not sys.platform.startswith("linux"):
+        # macOS only supports sendfile() towards sockets. Claim the name
+        # first so copyfile only ever overwrites a file created here.
+        with open(dst, "xb"):
+            pass
+        shutil.copyfile(src, dst)
+        return
+    in_fd = os.open(src, os.O_RDONLY)
+    try:
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            _linux_copy_fds(in_fd, out_fd)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+
+def _fast_move(src: str, dst: str) -> None:
+    """Move a file, using a kernel-side copy when crossing filesystems.
+
+    An existing ``dst`` is never replaced, whichever path the move takes.
+
+    Args:
+        src: File to move.
+        dst: Final path of the file; must not exist yet.
+
+    Returns:
+        None.
+
+    Raises:
+        FileExistsError: If ``dst`` already exists; ``src`` is left alone.
+
+    Side Effects:
+        Renames ``src`` or copies it to ``dst`` and removes the original.
+        Remembers destination folders that cannot be reached by a rename.
+    """
+    dst_folder = os.path.dirname(dst)
+    if dst_folder not in _cross_device_folders:
+        try:
+            _rename_no_replace(src, dst)
+            return
+        except OSError as err:
+            if err.errno != errno.EXDEV:
+                raise
+        _cross_device_folders.add(dst_folder)
+    try:
+        _copy_file_contents(src, dst)
+    except FileExistsError:
+        # Someone else's file; only copies made here are cleaned up.
+        raise
+    except BaseException:
+        # Never leave a truncated copy behind next to the untouched source.
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
+    os.unlink(src)
+
+
+def _ask_meme() -> bool:
+    """Ask whether a media file is a meme, reusing a recent answer.
+
+    Returns:
+        bool: ``True`` if the file should go to the Memes folder.
+
+    Side Effects:
+        Shows the Tk prompt unless the user answered less than
+        ``MEME_ANSWER_TTL_SECONDS`` ago; records the answer and its time.
+    """
+    global _last_meme_answer
+    if _last_meme_answer is not None:
+        answered_at, answer = _last_meme_answer
+        if time.monotonic() - answered_at < MEME_ANSWER_TTL_SECONDS:
+            return answer
+    import auto_gui
+
+    answer = auto_gui.meme_yes_no()
+    _last_meme_answer = (time.monotonic(), answer)
+    return answer
+
+
+def _folder_for_extension(ext: str, ask_meme: bool = False) -> Optional[str]:
+    """Map a lower-case extension to its configured destination folder.
+
+    Args:
+        ext: Extension including the leading dot, already lower-cased.
+        ask_meme: Whether to prompt the user when classifying media files.
+
+    Returns:
+        Optional[str]: Destination folder or ``None`` if no match is found.
+
+    Side Effects:
+        May invoke a GUI prompt when ``ask_meme`` is ``True``.
+    """
+    category = EXT_TO_CATEGORY.get(ext)
+    if category is None:
+        return None
+    if ask_meme and meme_enabled and category == "Media" and _ask_meme():
+        return PATH_TO_FOLDERS["Memes"]
+    return PATH_TO_FOLDERS[category]
+
+
+def needs_meme_prompt(path: str) -> bool:
+    """Check whether sorting ``path`` would ask the user about memes.
+
+    Args:
+        path: File path to classify.
+
+    Returns:
+        bool: ``True`` for media files while the meme prompt is enabled.
+
+    Side Effects:
+        None.
+    """
+    return meme_enabled and EXT_TO_CATEGORY.get(_ext_of(path)) == "Media"
+
+
 def resolve_destination(path: str, ask_meme: bool = False) -> Optional[str]:
     """Determine the destination folder for a file based on its extension.
 
@@ -120,24 +576,19 @@ def resolve_destination(path: str, ask_meme: bool = False) -> Optional[str]:
     Side Effects:
         May invoke a GUI prompt when ``ask_meme`` is ``True``.
     """
-    entry_name = os.path.basename(path)
-    if should_skip_by_extension(entry_name) or not os.path.isfile(path):
+    ext = _ext_of(path)
+    if ext in SKIP_EXTENSIONS or not os.path.isfile(path):
         return None
-    ext = os.path.splitext(entry_name)[1].lower()
-    for category, extensions in file_types.items():
-        if ext in extensions:
-            if category == "Media" and meme_enabled and ask_meme:
-                return (
-                    PATH_TO_FOLDERS["Memes"]
-                    if auto_gui.meme_yes_no()
-                    else PATH_TO_FOLDERS["Media"]
-                )
-            return PATH_TO_FOLDERS[category]
-    return None
+    return _folder_for_extension(ext, ask_meme=ask_meme)
 
 
 def sort_file(
-    path: str, notify: bool = True, planned_dest: Optional[str] = None
+    path: str,
+    notify: bool = True,
+    planned_dest: Optional[str] = None,
+    initial_size: Optional[int] = None,
+    wait_for_download: bool = True,
+    listings: Optional[dict[str, set[str]]] = None,
 ) -> Optional[str]:
     """Move a single file to its destination folder.
 
@@ -145,6 +596,12 @@ def sort_file(
         path: Path of the file to move.
         notify: Whether to display a notification after moving.
         planned_dest: Destination folder override.
+        initial_size: Size already known to the caller, forwarded to
+            ``is_file_fully_downloaded`` to skip its first size read.
+        wait_for_download: Whether to poll until the file is stable first.
+            Callers that already know the writer closed the file pass ``False``.
+        listings: Per-folder name sets shared across one batch so each
+            destination is listed at most once; see ``check_name``.
 
     Returns:
         Optional[str]: Final destination path if the file was moved.
@@ -162,35 +619,46 @@ def sort_file(
     )
     if not dest_folder:
         return None
-    os.makedirs(dest_folder, exist_ok=True)
-    destination_path = check_name(dest_folder, entry_name)
-    if is_file_fully_downloaded(path):
-        shutil.move(path, destination_path)
-        logging.info('Moved file: "%s" to folder: %s', entry_name, dest_folder)
-        if notify:
-            folder_uri = Path(dest_folder).resolve().as_uri()
-            buttons = [
-                {
-                    "activationType": "protocol",
-                    "arguments": folder_uri,
-                    "content": "Open Folder",
-                },
-                {"activationType": "protocol", "arguments": "", "content": "Close"},
-            ]
-            show_notification(
-                message=f'- "{entry_name[:30]}" \n Moved to \n - {dest_folder}',
-                title="File moved:",
-                select_file=destination_path,
-                duration="long",
-                buttons=buttons,
-            )
-        return destination_path
-    return None
+    if wait_for_download and not is_file_fully_downloaded(
+        path, initial_size=initial_size
+    ):
+        return None
+    taken = None
+    with _names_lock:
+        if listings is not None:
+            taken = listings.get(dest_folder)
+            if taken is None:
+                taken = listings[dest_folder] = _taken_names(dest_folder)
+        destination_path = check_name(dest_folder, entry_name, taken)
+    _fast_move(path, destination_path)
+    logging.info('Moved file: "%s" to folder: %s', entry_name, dest_folder)
+    if notify:
+        folder_uri = Path(dest_folder).resolve().as_uri()
+        buttons = [
+            {
+                "activationType": "protocol",
+                "arguments": folder_uri,
+                "content": "Open Folder",
+            },
+            {"activationType": "protocol", "arguments": "", "content": "Close"},
+        ]
+        show_notification(
+            message=f'- "{entry_name[:30]}" \n Moved to \n - {dest_folder}',
+            title="File moved:",
+            select_file=destination_path,
+            duration="long",
+            buttons=buttons,
+        )
+    return destination_path
 
 
 def sort_files() -> None:
     """Scan the Downloads folder and move eligible files.
 
+    Files are moved concurrently on ``_move_pool``; progress is reported in
+    completion order. A call made while another scan is running does nothing,
+    since that scan already covers the same files.
+
     Returns:
         None.
 
@@ -198,37 +666,68 @@ def sort_files() -> None:
         Moves files, displays notifications and progress toasts, and creates
         destination folders as needed.
     """
+    if not _scan_lock.acquire(blocking=False):
+        logging.debug("sort_files already running; skipping")
+        return
     moved_files: list[str] = []
     try:
         if not os.path.exists(DOWNLOADS_FOLDER_PATH):
             return
+        candidates: list[tuple[str, str, int]] = []
         with os.scandir(DOWNLOADS_FOLDER_PATH) as entries:
-            raw_files = [e.path for e in entries if e.is_file()]
-        candidates: list[tuple[str, str]] = []
-        for p in raw_files:
-            base = os.path.basename(p)
-            if should_skip_by_extension(base):
-                continue
-            dest = resolve_destination(p, ask_meme=False)
-            if dest is not None:
-                candidates.append((p, dest))
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                # Only the last dot matters here; splitext's edge-case handling
+                # is left to check_name where exact names are built.
+                ext = _ext_of(entry.name)
+                if ext in SKIP_EXTENSIONS:
+                    continue
+                dest = _folder_for_extension(ext)
+                if dest is not None:
+                    # DirEntry caches this stat (and on Windows fills it from
+                    # the directory listing), so it is the only one per file.
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError as error:
+                        # Removed or locked since the listing; skip just this one
+                        logging.warning("Skipping %s: %s", entry.name, error)
+                        continue
+                    candidates.append((entry.path, dest, st.st_size))
         total = len(candidates)
         if total == 0:
             return
         progress_begin(initial_status="Scanning & sorting…", total=total)
         progress_update(0, total, status="Starting…")
         done = 0
-        for file_path, dest_folder in candidates:
+        listings: dict[str, set[str]] = {}
+        futures = {
+            _move_pool.submit(
+                sort_file,
+                file_path,
+                notify=False,
+                planned_dest=dest_folder,
+                initial_size=size,
+                listings=listings,
+            ): (file_path, dest_folder)
+            for file_path, dest_folder, size in candidates
+        }
+        for future in concurrent.futures.as_completed(futures):
+            file_path, dest_folder = futures[future]
             name = os.path.basename(file_path)
-            short_name = (name[:25] + "…") if len(name) > 25 else name
-            dest_label = os.path.basename(dest_folder)
-            result = sort_file(file_path, notify=False, planned_dest=dest_folder)
+            try:
+                result = future.result()
+            except Exception as error:
+                logging.error("ERROR moving %s: %s", name, error, exc_info=True)
+                result = None
             if result:
                 moved_files.append(os.path.basename(result))
+            short_name = (name[:25] + "…") if len(name) > 25 else name
+            dest_label = os.path.basename(dest_folder)
             done += 1
             progress_update(done, total, status=f"{short_name} → {dest_label}")
         progress_complete("Batch complete")
-        print("DBG: moved_files = ", moved_files)
+        logging.debug("moved_files = %s", moved_files)
         if moved_files:
             max_list = 3
             listed = "\n".join(f"- {name[:45]}..." for name in moved_files[:max_list])
@@ -242,9 +741,11 @@ def sort_files() -> None:
                 },
                 {"activationType": "protocol", "arguments": "", "content": "Close"},
             ]
-            print("DBG: should call notification after progress bar")
             show_notification(
                 message=listed, title="Files moved:", duration="long", buttons=buttons
             )
     except Exception as error:  # pragma: no cover
         logging.error("ERROR: %s", error, exc_info=True)
+    finally:
+        _scan_lock.release()
+        flush_logs()
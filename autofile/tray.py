@@ -1,25 +1,98 @@
-"""System tray integration and file watcher for AutoSort."""
+"""System tray integration and file watcher for AutoSort.
+
+``pystray``, ``auto_gui`` and the watchdog observer backends are imported
+where they are first used, which keeps importing this module cheap; only the
+lightweight ``watchdog.events`` module is needed up front for the handler base
+class.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from dataclasses import dataclass
 from typing import Any, Optional
 
-import pystray
-from pystray import MenuItem as item
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from watchdog.observers import Observer
+from watchdog.events import (
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+    FileSystemEvent,
+    PatternMatchingEventHandler,
+)
 
-import auto_gui
-from .config import DOWNLOADS_FOLDER_PATH
+from .config import DOWNLOADS_FOLDER_PATH, POLL_INTERVAL_SECONDS, SKIP_EXTENSIONS
 from .notifications import APP_ID
-from .sorter import sort_file, sort_files, should_skip_by_extension
-
+from .sorter import (
+    _move_pool,
+    flush_logs,
+    needs_meme_prompt,
+    sort_file,
+    sort_files,
+    should_skip_by_extension,
+    stop_logging,
+)
+
+# One observer thread for the whole process; pausing only removes the watch.
 observer: Optional[Any] = None
+_watch: Optional[Any] = None
 pytray_icon: Optional[Any] = None
+# Watching state the tray menu last rendered; the menu starts out "stopped".
+_menu_watching = False
+
+# inotify reports IN_CLOSE_WRITE, so with that backend a file that was written
+# to is held back until its writer closes it. Other backends, including the
+# polling one Linux uses for network mounts, only have the quiet period and
+# the size check to go on. Set by ``create_observer``.
+CLOSE_EVENTS_SUPPORTED: bool = False
+
+# Filesystems whose native change notifications cannot be trusted.
+NETWORK_FS_TYPES = frozenset({"cifs", "smbfs", "smb3", "nfs", "nfs4"})
+
+# GetDriveTypeW return value for network drives.
+DRIVE_REMOTE = 4
+
+# Seconds a pending file must go without events and without any change in
+# size or modification time before it is sorted.
+STABLE_SECONDS: float = 1.0
+# Shorter quiet period for a file whose writer just closed it; the signature
+# check still has to pass, since a browser may rename its download over it.
+CLOSED_QUIET_SECONDS: float = 0.5
+# Longest a modified file is held back waiting for a close once its events
+# stop: a modified event can also be a metadata change made after the close
+# (chmod, setxattr, utime), and no further close follows one of those.
+CLOSE_WAIT_SECONDS: float = 30.0
+# How often pending files are re-checked while any are waiting.
+SWEEP_INTERVAL_SECONDS: float = 1.0
+
+# Raw watchdog events, consumed by the sweeper thread; ``None`` only wakes it.
+_event_q: queue.Queue[Optional[FileSystemEvent]] = queue.Queue()
+_sweeper_thread: Optional[threading.Thread] = None
+_sweeper_stop = threading.Event()
+
+# Sorting runs here so neither watchdog nor the sweeper ever blocks on a slow
+# move or a GUI prompt.
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="sorter"
+)
+# Files waiting on the meme prompt are sorted here, one dialog at a time, so
+# other downloads keep moving while the user decides.
+_prompt_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="prompt"
+)
+# Only one sorting job touches the Downloads folder at a time.
+_sort_lock = threading.Lock()
+# Paths ready to be sorted; new ones are folded into a drain that is already
+# scheduled instead of submitting another one.
+_ready_lock = threading.Lock()
+_ready_paths: list[str] = []
+_drain_scheduled = False
 
 
 def set_windows_app_id(app_id: str = APP_ID) -> None:
@@ -44,6 +117,25 @@ def set_windows_app_id(app_id: str = APP_ID) -> None:
         logging.warning("Failed to set AppUserModelID: %s", e)
 
 
+def refresh_menu(icon: Any) -> None:
+    """Ask the tray to re-query the menu if the watching state changed.
+
+    Args:
+        icon: Pystray icon instance.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Calls ``icon.update_menu`` only when the rendered state is stale.
+    """
+    global _menu_watching
+    watching = is_watching()
+    if watching != _menu_watching:
+        _menu_watching = watching
+        icon.update_menu()
+
+
 def start_action(icon: Any) -> None:
     """Start watching for file changes and refresh the menu.
 
@@ -54,10 +146,10 @@ def start_action(icon: Any) -> None:
         None.
 
     Side Effects:
-        Begins filesystem monitoring and updates the tray menu.
+        Begins filesystem monitoring and refreshes the menu if needed.
     """
     start_watching()
-    update_menu(icon)
+    refresh_menu(icon)
 
 
 def stop_action(icon: Any) -> None:
@@ -70,10 +162,10 @@ def stop_action(icon: Any) -> None:
         None.
 
     Side Effects:
-        Stops filesystem monitoring and updates the tray menu.
+        Stops filesystem monitoring and refreshes the menu if needed.
     """
     stop_watching()
-    update_menu(icon)
+    refresh_menu(icon)
 
 
 def quit_action(icon: Any) -> None:
@@ -86,41 +178,83 @@ def quit_action(icon: Any) -> None:
         None.
 
     Side Effects:
-        Stops the icon's event loop.
+        Stops monitoring and the observer thread, waits for queued and running
+        sorts to finish, flushes the log and stops the icon's event loop.
     """
+    stop_watching()
+    shutdown_observer()
+    # Drains and scans feed the prompt and mover pools, so they stop first;
+    # every sort's log records are written before logging shuts down.
+    _executor.shutdown(wait=True)
+    _prompt_executor.shutdown(wait=True)
+    _move_pool.shutdown(wait=True)
+    stop_logging()
     icon.stop()
 
 
-def update_menu(icon: Any) -> None:
-    """Rebuild the tray menu based on the observer state.
+def build_menu() -> Any:
+    """Create the tray menu once with state-dependent labels.
 
-    Args:
-        icon: Pystray icon instance.
+    The item text and enabled flags are callables evaluated against the current
+    watching state, so start/stop only need ``icon.update_menu()`` instead of a new
+    ``pystray.Menu``.
 
     Returns:
-        None.
+        Any: The ``pystray.Menu`` used by the tray icon.
 
     Side Effects:
-        Mutates the menu of the provided icon.
+        Imports ``pystray``.
     """
-    menu = pystray.Menu(
+    import pystray
+    from pystray import MenuItem as item
+
+    return pystray.Menu(
         item(
-            "Start" + (" (active)" if observer is not None else ""),
+            lambda _: "Start" + (" (active)" if is_watching() else ""),
             start_action,
-            enabled=observer is None,
+            enabled=lambda _: not is_watching(),
         ),
         item(
-            "Stop" + (" (active)" if observer is None else ""),
+            lambda _: "Stop" + (" (active)" if not is_watching() else ""),
             stop_action,
-            enabled=observer is not None,
+            enabled=lambda _: is_watching(),
         ),
         item("Quit", quit_action),
     )
-    icon.menu = menu
 
 
-class MyEventHandler(FileSystemEventHandler):
-    """Monitor changes in the Downloads folder and trigger sorting."""
+class MyEventHandler(PatternMatchingEventHandler):
+    """Forward Downloads folder changes to the sweeper thread.
+
+    Directory events and files with skip-listed extensions (partial
+    downloads) are filtered out by watchdog before any handler runs.
+    """
+
+    def __init__(self) -> None:
+        """Configure watchdog's filtering from ``SKIP_EXTENSIONS``.
+
+        Returns:
+            None.
+        """
+        super().__init__(
+            ignore_patterns=[f"*{ext}" for ext in sorted(SKIP_EXTENSIONS)],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle file creation events.
+
+        Args:
+            event: Watchdog event describing the change.
+
+        Returns:
+            None.
+
+        Side Effects:
+            Queues the event for the sweeper thread.
+        """
+        _event_q.put(event)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
@@ -132,50 +266,580 @@ class MyEventHandler(FileSystemEventHandler):
             None.
 
         Side Effects:
-            Sorts the file if eligible.
+            Queues the event for the sweeper thread.
+        """
+        _event_q.put(event)
+
+    def on_closed(self, event: FileSystemEvent) -> None:
+        """Handle a file being closed after it was written.
+
+        Args:
+            event: Watchdog event describing the change.
+
+        Returns:
+            None.
+
+        Side Effects:
+            Queues the event for the sweeper thread.
         """
-        time.sleep(1)
-        src = event.src_path if isinstance(event.src_path, str) else str(event.src_path)
-        if event.is_directory:
+        _event_q.put(event)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle a rename, e.g. a browser renaming a finished ``.part`` file.
+
+        Args:
+            event: Watchdog event describing the change.
+
+        Returns:
+            None.
+
+        Side Effects:
+            Queues the event for the sweeper thread.
+        """
+        _event_q.put(event)
+
+
+@dataclass
+class PendingFile:
+    """A file in Downloads that has not settled yet.
+
+    Attributes:
+        size: Size seen by the last sweep, or ``-1`` before the first one.
+        mtime_ns: Modification time seen by the last sweep, or ``-1``.
+        last_event: ``time.monotonic()`` of the latest event for the file.
+        writing: The file was modified since its last close.
+        closed: The latest event for the file was a close.
+        closed_signature: Size and modification time at the last close, or
+            ``None`` if no close was seen.
+    """
+
+    size: int = -1
+    mtime_ns: int = -1
+    last_event: float = 0.0
+    writing: bool = False
+    closed: bool = False
+    closed_signature: Optional[tuple[int, int]] = None
+
+
+def record_event(
+    event: FileSystemEvent, pending: dict[str, PendingFile], now: float
+) -> None:
+    """Track one watchdog event in the pending table.
+
+    A close event does not make a file ready on its own: browsers close a
+    zero-byte placeholder under the final name before renaming the real
+    download over it, so closed files still go through ``sweep_pending``,
+    just with the shorter ``CLOSED_QUIET_SECONDS`` window.
+
+    Args:
+        event: Watchdog event describing the change.
+        pending: Maps a path to its ``PendingFile``; the signature is
+            filled in by ``sweep_pending``.
+        now: Current ``time.monotonic()`` value.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Updates ``pending``; stats the file on a close event.
+    """
+    if event.is_directory:
+        return
+    moved = event.event_type == EVENT_TYPE_MOVED
+    path = os.fsdecode(event.dest_path if moved else event.src_path)
+    if should_skip_by_extension(os.path.basename(path)):
+        return
+    if moved:
+        # Renamed into place (the download finished under a temp name, so no
+        # close event follows for this name) or renamed away from Downloads.
+        pending.pop(os.fsdecode(event.src_path), None)
+        if os.path.dirname(path) != DOWNLOADS_FOLDER_PATH:
             return
-        base = os.path.basename(src)
-        if should_skip_by_extension(base):
+    # Created events still count on Linux: a file mv'd in from another
+    # directory only produces one, with no close or moved event after it.
+    closed = event.event_type == EVENT_TYPE_CLOSED
+    writing = event.event_type == EVENT_TYPE_MODIFIED
+    entry = pending.get(path)
+    if entry is None:
+        entry = pending[path] = PendingFile(
+            last_event=now, writing=writing, closed=closed
+        )
+    else:
+        entry.last_event = now
+        entry.writing = not closed and (entry.writing or writing)
+        entry.closed = closed
+    if closed:
+        # Seed the signature so the next sweep can already confirm it.
+        try:
+            st = os.stat(path)
+        except OSError:
+            del pending[path]
             return
-        sort_file(src)
+        entry.size, entry.mtime_ns = st.st_size, st.st_mtime_ns
+        entry.closed_signature = (st.st_size, st.st_mtime_ns)
+
+
+def _rewritten_since_close(entry: PendingFile, st: os.stat_result) -> bool:
+    """Check whether a file's content may have changed since its last close.
+
+    Writes change the size or move the modification time forward, while a
+    metadata-only change leaves both alone or, like ``utime`` restoring a
+    server timestamp, moves the time back.
+
+    Args:
+        entry: Pending entry of the file.
+        st: Current ``os.stat`` result of the file.
+
+    Returns:
+        bool: ``True`` if no close was seen or the content may have changed.
+
+    Side Effects:
+        None.
+    """
+    if entry.closed_signature is None:
+        return True
+    size, mtime_ns = entry.closed_signature
+    return st.st_size != size or st.st_mtime_ns > mtime_ns
+
+
+def is_locked(path: str) -> bool:
+    """Check whether another process still holds ``path`` open on Windows.
+
+    Renaming a file onto itself fails with a sharing violation while a
+    downloader keeps it open, which answers in one call what repeated size
+    checks only guess.
+
+    Args:
+        path: File to probe.
+
+    Returns:
+        bool: ``True`` if the file is locked; always ``False`` elsewhere.
+
+    Side Effects:
+        None; the rename is a no-op when it succeeds.
+    """
+    if not sys.platform.startswith("win"):
+        return False
+    try:
+        os.rename(path, path)
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+def _has_partial_sibling(path: str) -> bool:
+    """Check whether a download is still in progress next to ``path``.
+
+    Args:
+        path: File that looks settled.
+
+    Returns:
+        bool: ``True`` if ``path`` plus any skip-listed extension exists,
+        e.g. ``report.pdf.part`` beside Firefox's ``report.pdf`` placeholder.
+
+    Side Effects:
+        Checks the filesystem.
+    """
+    return any(os.path.exists(path + ext) for ext in SKIP_EXTENSIONS)
+
+
+def sweep_pending(pending: dict[str, PendingFile], now: float) -> list[str]:
+    """Pick the pending files that have settled.
+
+    A file is ready once it has had no events for ``STABLE_SECONDS`` (or
+    ``CLOSED_QUIET_SECONDS`` after a close), its size and modification time
+    match the previous sweep, no partial download sits beside it and no
+    writer still holds it open: on Linux a file written since its last close
+    waits for its next close event, for at most ``CLOSE_WAIT_SECONDS`` of
+    silence, and on Windows a sharing-violation probe decides. Empty files
+    are sorted like any other; a browser's zero-byte placeholder is held
+    back by its partial sibling instead. This costs one ``stat`` per pending
+    file per sweep instead of a blocking poll per file.
+
+    Args:
+        pending: Table maintained by ``record_event``.
+        now: Current ``time.monotonic()`` value.
+
+    Returns:
+        list[str]: Paths that are ready to be sorted; removed from ``pending``.
+
+    Side Effects:
+        Stats pending files and updates ``pending``.
+    """
+    ready: list[str] = []
+    for path, entry in list(pending.items()):
+        try:
+            st = os.stat(path)
+        except OSError:
+            del pending[path]
+            continue
+        unchanged = entry.size == st.st_size and entry.mtime_ns == st.st_mtime_ns
+        quiet = CLOSED_QUIET_SECONDS if entry.closed else STABLE_SECONDS
+        still_open = (
+            CLOSE_EVENTS_SUPPORTED
+            and entry.writing
+            and _rewritten_since_close(entry, st)
+            and now - entry.last_event < CLOSE_WAIT_SECONDS
+        )
+        if (
+            unchanged
+            and now - entry.last_event >= quiet
+            and not still_open
+            and not _has_partial_sibling(path)
+            and not is_locked(path)
+        ):
+            del pending[path]
+            ready.append(path)
+        else:
+            entry.size, entry.mtime_ns = st.st_size, st.st_mtime_ns
+    return ready
+
+
+def sort_ready_paths(paths: list[str]) -> None:
+    """Sort files that are known to be complete.
+
+    Args:
+        paths: Files to sort.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Moves files without waiting for their size to settle; media files are
+        handed to ``_prompt_executor``.
+    """
+    for path in dict.fromkeys(paths):
+        if needs_meme_prompt(path):
+            _prompt_executor.submit(_sort_ready_path, path)
+        else:
+            _sort_ready_path(path)
+
+
+def _sort_ready_path(path: str) -> None:
+    """Sort one complete file, logging instead of raising on failure.
+
+    Args:
+        path: File to sort.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Moves the file, may show the meme prompt and flushes the log, since
+        on ``_prompt_executor`` nothing else would.
+    """
+    try:
+        sort_file(path, wait_for_download=False)
+    except Exception as error:  # pragma: no cover
+        logging.error("ERROR sorting %s: %s", path, error, exc_info=True)
+    finally:
+        flush_logs()
+
+
+def _drain_ready_paths() -> None:
+    """Sort ready paths until none are left.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Moves files while holding ``_sort_lock``.
+    """
+    global _drain_scheduled
+    with _sort_lock:
+        while True:
+            with _ready_lock:
+                if not _ready_paths:
+                    _drain_scheduled = False
+                    break
+                batch = _ready_paths[:]
+                _ready_paths.clear()
+            sort_ready_paths(batch)
+
+
+def submit_ready_paths(paths: list[str]) -> None:
+    """Hand settled files to the sorter thread pool.
+
+    Args:
+        paths: Files that are ready to be sorted.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Schedules ``_drain_ready_paths`` unless a drain is already pending.
+    """
+    global _drain_scheduled
+    with _ready_lock:
+        _ready_paths.extend(paths)
+        if _drain_scheduled:
+            return
+        _drain_scheduled = True
+    _executor.submit(_drain_ready_paths)
+
+
+def _sort_all_locked() -> None:
+    """Run a full Downloads scan without overlapping other sorting jobs.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Moves files while holding ``_sort_lock``.
+    """
+    with _sort_lock:
+        sort_files()
+
+
+def _sweeper() -> None:
+    """Track watcher events and sort files once they have settled.
+
+    Blocks without a timeout while nothing is pending, so an idle watcher
+    never wakes up.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Consumes ``_event_q`` until ``_sweeper_stop`` is set; meant to run on
+        a daemon thread.
+    """
+    pending: dict[str, PendingFile] = {}
+    next_sweep = 0.0
+    while not _sweeper_stop.is_set():
+        try:
+            event = _event_q.get(timeout=SWEEP_INTERVAL_SECONDS if pending else None)
+            while True:
+                if event is not None:
+                    record_event(event, pending, time.monotonic())
+                event = _event_q.get_nowait()
+        except queue.Empty:
+            pass
+        now = time.monotonic()
+        if pending and now >= next_sweep:
+            ready = sweep_pending(pending, now)
+            next_sweep = now + SWEEP_INTERVAL_SECONDS
+            if ready:
+                submit_ready_paths(ready)
+
+
+def _ensure_sweeper() -> None:
+    """Start the sweeper thread if it is not running yet.
+
+    Returns:
+        None.
+
+    Side Effects:
+        May start a daemon thread.
+    """
+    global _sweeper_thread
+    if _sweeper_thread is None or not _sweeper_thread.is_alive():
+        _sweeper_stop.clear()
+        _sweeper_thread = threading.Thread(
+            target=_sweeper, name="autosort-sweeper", daemon=True
+        )
+        _sweeper_thread.start()
+
+
+def _stop_sweeper() -> None:
+    """Stop the sweeper thread and wait for it to exit.
+
+    Files still pending are dropped; the scan on the next start picks them up.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Sets ``_sweeper_stop`` and wakes the sweeper.
+    """
+    global _sweeper_thread
+    if _sweeper_thread is not None:
+        _sweeper_stop.set()
+        _event_q.put(None)
+        _sweeper_thread.join()
+        _sweeper_thread = None
+
+
+def _is_remote_windows_drive(path: str) -> bool:
+    """Check whether a path lives on a Windows network drive.
+
+    Args:
+        path: Path to inspect.
+
+    Returns:
+        bool: ``True`` for mapped network drives and UNC shares.
+
+    Side Effects:
+        None; always ``False`` on other platforms.
+    """
+    if not sys.platform.startswith("win"):
+        return False
+    import ctypes
+
+    root = os.path.splitdrive(os.path.abspath(path))[0] + "\\"
+    return bool(ctypes.windll.kernel32.GetDriveTypeW(root) == DRIVE_REMOTE)
+
+
+def _linux_fs_type(path: str, mounts_file: str = "/proc/mounts") -> str:
+    """Return the filesystem type of the mount containing ``path``.
+
+    Args:
+        path: Path to inspect.
+        mounts_file: Mount table in ``/proc/mounts`` format.
+
+    Returns:
+        str: Filesystem type, or an empty string if it cannot be determined.
+
+    Side Effects:
+        Reads the mount table.
+    """
+    real = os.path.realpath(path)
+    best_mount, fs_type = "", ""
+    try:
+        with open(mounts_file, encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return ""
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # Spaces and other separators are octal-escaped, e.g. "\040".
+        mount_point = re.sub(
+            r"\\([0-7]{3})", lambda m: chr(int(m.group(1), 8)), fields[1]
+        )
+        inside = real == mount_point or real.startswith(mount_point.rstrip("/") + "/")
+        if inside and len(mount_point) >= len(best_mount):
+            best_mount, fs_type = mount_point, fields[2]
+    return fs_type
+
+
+def is_network_path(path: str) -> bool:
+    """Check whether a path lives on a network filesystem.
+
+    Args:
+        path: Path to inspect.
+
+    Returns:
+        bool: ``True`` for SMB/CIFS/NFS locations where kernel change
+        notifications are unreliable.
+
+    Side Effects:
+        Queries the OS for drive or mount information.
+    """
+    if sys.platform.startswith("win"):
+        return _is_remote_windows_drive(path)
+    if sys.platform.startswith("linux"):
+        return _linux_fs_type(path) in NETWORK_FS_TYPES
+    return False
+
+
+def create_observer(path: str) -> Any:
+    """Pick the watchdog observer best suited to ``path``.
+
+    Args:
+        path: Folder that will be watched.
+
+    Returns:
+        Any: A ``PollingObserver`` for network mounts, otherwise the native
+        kernel-notification ``Observer``.
+
+    Side Effects:
+        Queries the OS for drive or mount information, imports the backend,
+        logs which one was chosen and sets ``CLOSE_EVENTS_SUPPORTED`` to
+        whether it reports close events.
+    """
+    global CLOSE_EVENTS_SUPPORTED
+    if is_network_path(path):
+        from watchdog.observers.polling import PollingObserver
+
+        logging.info(
+            "Watching %s with PollingObserver every %ss (network filesystem)",
+            path,
+            POLL_INTERVAL_SECONDS,
+        )
+        CLOSE_EVENTS_SUPPORTED = False
+        return PollingObserver(timeout=POLL_INTERVAL_SECONDS)
+    from watchdog.observers import Observer
+
+    native = Observer()
+    # Observer is an alias of the platform backend, e.g. InotifyObserver, and
+    # falls back to polling where that backend is unavailable.
+    backend = type(native).__name__
+    CLOSE_EVENTS_SUPPORTED = backend == "InotifyObserver"
+    logging.info("Watching %s with %s", path, backend)
+    return native
+
+
+def is_watching() -> bool:
+    """Report whether the Downloads folder is currently monitored.
+
+    Returns:
+        bool: ``True`` while a watch is scheduled.
+    """
+    return _watch is not None
 
 
 def start_watching() -> None:
     """Begin monitoring the Downloads folder.
 
+    The observer thread is created and started on first use and then reused,
+    so pausing and resuming only adds and removes the watch.
+
     Returns:
         None.
 
     Side Effects:
-        Starts a watchdog observer and may immediately sort existing files.
+        May start the observer thread, schedules the watch and queues a sort
+        of existing files.
     """
-    global observer
-    if observer is None:
-        event_handler = MyEventHandler()
-        observer = Observer()
-        observer.schedule(event_handler, DOWNLOADS_FOLDER_PATH, recursive=True)
-        observer.start()
-        sort_files()
+    global observer, _watch
+    if _watch is None:
+        _ensure_sweeper()
+        if observer is None:
+            observer = create_observer(DOWNLOADS_FOLDER_PATH)
+            observer.start()
+        # Only top-level files are sorted, so subfolders need no watches
+        _watch = observer.schedule(
+            MyEventHandler(), DOWNLOADS_FOLDER_PATH, recursive=False
+        )
+        _executor.submit(_sort_all_locked)
 
 
 def stop_watching() -> None:
-    """Stop the active watchdog observer.
+    """Pause monitoring of the Downloads folder.
 
     Returns:
         None.
 
     Side Effects:
-        Terminates the observer thread.
+        Removes the watch, releasing its kernel watch descriptor, and stops
+        the sweeper thread; the observer thread keeps running idle.
     """
-    global observer
+    global _watch
+    if _watch is not None and observer is not None:
+        observer.unschedule(_watch)
+        _watch = None
+        _stop_sweeper()
+
+
+def shutdown_observer() -> None:
+    """Stop the observer thread for good.
+
+    Returns:
+        None.
+
+    Side Effects:
+        Stops and joins the observer thread.
+    """
+    global observer, _watch
     if observer is not None:
         observer.stop()
         observer.join()
         observer = None
+        _watch = None
 
 
 def main() -> None:
@@ -190,19 +854,20 @@ def main() -> None:
     """
     global pytray_icon
     try:
+        import pystray
+
+        import auto_gui
+
         set_windows_app_id(APP_ID)
         pytray_icon = pystray.Icon(
             "my_pytray_icon",
             icon=auto_gui.create_icon(64, 64),
             title="AutoSort",
-            menu=pystray.Menu(
-                item("Start (active)", start_action, enabled=False),
-                item("Stop", stop_action),
-                item("Quit", quit_action),
-            ),
+            menu=build_menu(),
         )
         pytray_icon.run_detached()
         start_watching()
+        refresh_menu(pytray_icon)
     except Exception as error:  # pragma: no cover
         logging.error("ERROR in main setup: %s", error, exc_info=True)
         sys.exit(1)
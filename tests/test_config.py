@@ -7,6 +7,7 @@ from autofile.config import (
     DEFAULT_FILE_TYPES,
     DEFAULT_SKIP_EXTENSIONS,
     _normalize_extensions,
+    build_extension_map,
     load_config,
 )
 
@@ -69,3 +70,18 @@ def test_load_config_no_categories_uses_defaults(tmp_path: Path) -> None:
 
     assert categories == DEFAULT_FILE_TYPES
     assert skip_exts == {".bak"}
+
+
+def test_build_extension_map_first_category_wins() -> None:
+    """Extensions listed under several categories keep the first category.
+
+    Mirrors the previous first-match scan over ``file_types`` so that, for
+    example, ``.sh`` keeps going to Programs rather than Development.
+    """
+    categories = {"Programs": [".sh", ".exe"], "Development": [".py", ".sh"]}
+
+    assert build_extension_map(categories) == {
+        ".sh": "Programs",
+        ".exe": "Programs",
+        ".py": "Development",
+    }
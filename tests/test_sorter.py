@@ -1,11 +1,14 @@
 """Tests for sorting logic and helpers."""
 
+import errno
 import os
 from pathlib import Path
 
 import pytest
 
+import auto_gui
 from autofile import sorter
+from autofile.config import build_extension_map
 
 
 def test_should_skip_by_extension(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -33,12 +36,13 @@ def test_resolve_destination_known_extension(
     for p in (docs, media, memes):
         p.mkdir()
 
-    monkeypatch.setattr(sorter, "file_types", {"Docs": [".txt"], "Media": [".jpg"]})
+    folders = {"Docs": str(docs), "Media": str(media), "Memes": str(memes)}
     monkeypatch.setattr(
         sorter,
-        "PATH_TO_FOLDERS",
-        {"Docs": str(docs), "Media": str(media), "Memes": str(memes)},
+        "EXT_TO_CATEGORY",
+        build_extension_map({"Docs": [".txt"], "Media": [".jpg"]}),
     )
+    monkeypatch.setattr(sorter, "PATH_TO_FOLDERS", folders)
     monkeypatch.setattr(sorter, "SKIP_EXTENSIONS", set())
 
     file_path = tmp_path / "note.txt"
@@ -56,14 +60,14 @@ def test_resolve_destination_media_meme_prompt(
     for p in (docs, media, memes):
         p.mkdir()
 
-    monkeypatch.setattr(sorter, "file_types", {"Media": [".jpg"]})
+    folders = {"Docs": str(docs), "Media": str(media), "Memes": str(memes)}
     monkeypatch.setattr(
-        sorter,
-        "PATH_TO_FOLDERS",
-        {"Docs": str(docs), "Media": str(media), "Memes": str(memes)},
+        sorter, "EXT_TO_CATEGORY", build_extension_map({"Media": [".jpg"]})
     )
+    monkeypatch.setattr(sorter, "PATH_TO_FOLDERS", folders)
     monkeypatch.setattr(sorter, "SKIP_EXTENSIONS", set())
-    monkeypatch.setattr(sorter.auto_gui, "meme_yes_no", lambda: True)
+    monkeypatch.setattr(sorter, "_last_meme_answer", None)
+    monkeypatch.setattr(auto_gui, "meme_yes_no", lambda: True)
 
     file_path = tmp_path / "funny.jpg"
     file_path.write_text("img")
@@ -71,6 +75,27 @@ def test_resolve_destination_media_meme_prompt(
     assert sorter.resolve_destination(str(file_path), ask_meme=True) == str(memes)
 
 
+def test_meme_answer_reused_within_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Media files arriving together share one prompt answer until it expires."""
+    answers = iter([True, False])
+    prompts: list[bool] = []
+
+    def fake_prompt() -> bool:
+        prompts.append(True)
+        return next(answers)
+
+    monkeypatch.setattr(sorter, "_last_meme_answer", None)
+    monkeypatch.setattr(auto_gui, "meme_yes_no", fake_prompt)
+
+    assert sorter._ask_meme() is True
+    assert sorter._ask_meme() is True
+    assert len(prompts) == 1
+
+    monkeypatch.setattr(sorter, "MEME_ANSWER_TTL_SECONDS", 0.0)
+    assert sorter._ask_meme() is False
+    assert len(prompts) == 2
+
+
 def test_resolve_destination_unknown_extension_returns_none(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -78,8 +103,11 @@ def test_resolve_destination_unknown_extension_returns_none(
     docs = tmp_path / "Docs"
     docs.mkdir()
 
-    monkeypatch.setattr(sorter, "file_types", {"Docs": [".txt"]})
-    monkeypatch.setattr(sorter, "PATH_TO_FOLDERS", {"Docs": str(docs)})
+    folders = {"Docs": str(docs)}
+    monkeypatch.setattr(
+        sorter, "EXT_TO_CATEGORY", build_extension_map({"Docs": [".txt"]})
+    )
+    monkeypatch.setattr(sorter, "PATH_TO_FOLDERS", folders)
     monkeypatch.setattr(sorter, "SKIP_EXTENSIONS", set())
 
     file_path = tmp_path / "file.bin"
@@ -104,7 +132,9 @@ def test_sort_file_handles_duplicates(
     new_file = src / "file.txt"
     new_file.write_text("new")
 
-    monkeypatch.setattr(sorter, "is_file_fully_downloaded", lambda p: True)
+    monkeypatch.setattr(
+        sorter, "is_file_fully_downloaded", lambda p, initial_size=None: True
+    )
     result = sorter.sort_file(str(new_file), notify=False, planned_dest=str(dest))
 
     assert result is not None
@@ -126,10 +156,155 @@ def test_sort_file_skips_configured_extensions(
     to_skip.write_text("temp")
 
     monkeypatch.setattr(sorter, "SKIP_EXTENSIONS", {".tmp"})
-    monkeypatch.setattr(sorter, "is_file_fully_downloaded", lambda p: True)
+    monkeypatch.setattr(
+        sorter, "is_file_fully_downloaded", lambda p, initial_size=None: True
+    )
 
     result = sorter.sort_file(str(to_skip), notify=False, planned_dest=str(dest))
 
     assert result is None
     assert to_skip.exists()
     assert not (dest / "ignore.tmp").exists()
+
+
+def test_fast_move_cross_device_copies_and_removes_source(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A rename failing with ``EXDEV`` falls back to copy-then-unlink."""
+    src = tmp_path / "big.bin"
+    dst = tmp_path / "moved.bin"
+    payload = os.urandom(3 * 1024 * 1024 + 17)
+    src.write_bytes(payload)
+
+    def cross_device_rename(a: str, b: str) -> None:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(sorter, "_rename_no_replace", cross_device_rename)
+    monkeypatch.setattr(sorter, "_cross_device_folders", set())
+    sorter._fast_move(str(src), str(dst))
+
+    assert not src.exists()
+    assert dst.read_bytes() == payload
+
+
+def test_fast_move_skips_rename_for_known_cross_device_folder(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After one ``EXDEV`` the destination folder goes straight to copying."""
+    renames: list[str] = []
+
+    def cross_device_rename(a: str, b: str) -> None:
+        renames.append(a)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(sorter, "_rename_no_replace", cross_device_rename)
+    monkeypatch.setattr(sorter, "_cross_device_folders", set())
+    for name in ("a.bin", "b.bin"):
+        (tmp_path / name).write_bytes(b"x")
+        sorter._fast_move(str(tmp_path / name), str(tmp_path / f"moved_{name}"))
+
+    assert renames == [str(tmp_path / "a.bin")]
+    assert (tmp_path / "moved_b.bin").exists()
+
+
+@pytest.mark.parametrize("cross_device", [False, True])
+def test_fast_move_never_replaces_an_existing_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cross_device: bool
+) -> None:
+    """Both the rename and the copy path refuse to clobber ``dst``."""
+    src = tmp_path / "new.bin"
+    dst = tmp_path / "old.bin"
+    src.write_bytes(b"new")
+    dst.write_bytes(b"old")
+    folders = {str(tmp_path)} if cross_device else set()
+    monkeypatch.setattr(sorter, "_cross_device_folders", folders)
+
+    with pytest.raises(FileExistsError):
+        sorter._fast_move(str(src), str(dst))
+
+    assert src.read_bytes() == b"new"
+    assert dst.read_bytes() == b"old"
+
+
+def test_is_file_fully_downloaded_reports_missing_file(tmp_path: Path) -> None:
+    """A file that disappears while being watched is not treated as complete."""
+    missing = tmp_path / "gone.bin"
+    assert (
+        sorter.is_file_fully_downloaded(
+            str(missing), initial_size=10, wait_time=0.01, min_interval=0.001
+        )
+        is False
+    )
+
+
+def test_is_file_fully_downloaded_stable_file(tmp_path: Path) -> None:
+    """An unchanged file is confirmed once it stays stable for ``wait_time``."""
+    done = tmp_path / "done.bin"
+    done.write_bytes(b"x" * 10)
+    assert sorter.is_file_fully_downloaded(
+        str(done), initial_size=10, wait_time=0.01, min_interval=0.001
+    )
+
+
+def test_check_name_ignores_case_when_resolving_collisions(tmp_path: Path) -> None:
+    """Collisions are detected regardless of case, as on NTFS and APFS."""
+    (tmp_path / "Report.PDF").write_text("a")
+    (tmp_path / "report_(1).pdf").write_text("b")
+
+    result = sorter.check_name(str(tmp_path), "report.pdf")
+
+    assert result == os.path.join(str(tmp_path), "report_(2).pdf")
+
+
+def test_check_name_reserves_names_in_shared_listing(tmp_path: Path) -> None:
+    """A shared listing hands out distinct names without touching the disk."""
+    (tmp_path / "a.txt").write_text("a")
+    taken = sorter._taken_names(str(tmp_path))
+
+    first = sorter.check_name(str(tmp_path), "a.txt", taken)
+    second = sorter.check_name(str(tmp_path), "a.txt", taken)
+
+    assert os.path.basename(first) == "a_(1).txt"
+    assert os.path.basename(second) == "a_(2).txt"
+
+
+def test_sort_file_recreates_missing_destination(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A destination folder deleted after startup is created on demand."""
+    new_file = tmp_path / "note.txt"
+    new_file.write_text("data")
+    dest = tmp_path / "gone" / "Docs"
+
+    monkeypatch.setattr(
+        sorter, "is_file_fully_downloaded", lambda p, initial_size=None: True
+    )
+    result = sorter.sort_file(str(new_file), notify=False, planned_dest=str(dest))
+
+    assert result == os.path.join(str(dest), "note.txt")
+    assert os.path.exists(result)
+
+
+def test_sort_files_skips_when_scan_in_progress(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An overlapping scan returns immediately instead of racing the first.
+
+    A normal run looks at the file and releases the scan lock again.
+    """
+    (tmp_path / "a.pdf").write_bytes(b"x")
+    looked_up: list[str] = []
+    monkeypatch.setattr(sorter, "DOWNLOADS_FOLDER_PATH", str(tmp_path))
+    monkeypatch.setattr(
+        sorter,
+        "_folder_for_extension",
+        lambda ext, ask_meme=False: looked_up.append(ext),
+    )
+
+    with sorter._scan_lock:
+        sorter.sort_files()
+    assert looked_up == []
+
+    sorter.sort_files()
+    assert looked_up == [".pdf"]
+    assert not sorter._scan_lock.locked()
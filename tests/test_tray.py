@@ -0,0 +1,334 @@
+"""Tests for watcher helpers in the tray module."""
+
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from watchdog.events import (
+    DirModifiedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+)
+
+from autofile import tray
+
+
+def test_linux_fs_type_uses_longest_mount_prefix(tmp_path: Path) -> None:
+    """The deepest mount containing the path decides its filesystem type.
+
+    Mount points with spaces are octal-escaped in ``/proc/mounts`` and must be
+    decoded before matching.
+    """
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n" "//srv/share /home/u/My\\040Downloads cifs rw 0 0\n"
+    )
+
+    assert tray._linux_fs_type("/home/u/My Downloads/x.pdf", str(mounts)) == "cifs"
+    assert tray._linux_fs_type("/home/u/My Downloadsx", str(mounts)) == "ext4"
+
+
+def test_create_observer_disables_close_events_for_polling(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A polling observer never reports closes, even on Linux."""
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", True)
+    monkeypatch.setattr(tray, "is_network_path", lambda p: True)
+
+    observer = tray.create_observer(str(tmp_path))
+
+    assert type(observer).__name__ == "PollingObserver"
+    assert tray.CLOSE_EVENTS_SUPPORTED is False
+
+
+def test_record_event_tracks_pending_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Events mark files as pending.
+
+    Directory events and skip-listed files never enter the pending table.
+    """
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", False)
+    monkeypatch.setattr(tray, "should_skip_by_extension", lambda n: n.endswith(".tmp"))
+    pending: dict[str, tray.PendingFile] = {}
+
+    tray.record_event(FileCreatedEvent("/dl/a.pdf"), pending, 1.0)
+    tray.record_event(FileModifiedEvent("/dl/a.pdf"), pending, 2.0)
+    tray.record_event(FileModifiedEvent("/dl/b.zip"), pending, 2.0)
+    tray.record_event(FileModifiedEvent("/dl/c.tmp"), pending, 2.0)
+    tray.record_event(DirModifiedEvent("/dl"), pending, 2.0)
+    assert pending == {
+        "/dl/a.pdf": tray.PendingFile(last_event=2.0, writing=True),
+        "/dl/b.zip": tray.PendingFile(last_event=2.0, writing=True),
+    }
+
+
+def test_closed_files_still_wait_for_a_stable_signature(tmp_path: Path) -> None:
+    """A close event only shortens the quiet period before a file is sorted."""
+    done = tmp_path / "a.pdf"
+    done.write_bytes(b"data")
+    pending: dict[str, tray.PendingFile] = {}
+
+    tray.record_event(FileModifiedEvent(str(done)), pending, 1.0)
+    tray.record_event(FileClosedEvent(str(done)), pending, 2.0)
+    st = done.stat()
+    sig = (st.st_size, st.st_mtime_ns)
+    assert pending == {
+        str(done): tray.PendingFile(*sig, 2.0, closed=True, closed_signature=sig)
+    }
+
+    assert tray.sweep_pending(pending, 2.0) == []
+    assert tray.sweep_pending(pending, 2.0 + tray.CLOSED_QUIET_SECONDS) == [str(done)]
+
+
+def test_sweep_pending_waits_for_partials(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A ``.part`` sibling holds back the placeholder under the final name."""
+    monkeypatch.setattr(tray, "SKIP_EXTENSIONS", frozenset({".part"}))
+    placeholder = tmp_path / "report.pdf"
+    placeholder.write_bytes(b"")
+    pending: dict[str, tray.PendingFile] = {}
+    tray.record_event(FileClosedEvent(str(placeholder)), pending, 0.0)
+
+    (tmp_path / "report.pdf.part").write_bytes(b"data")
+    assert tray.sweep_pending(pending, 5.0) == []
+    assert list(pending) == [str(placeholder)]
+
+    (tmp_path / "report.pdf.part").replace(placeholder)
+    assert tray.sweep_pending(pending, 6.0) == []
+    assert tray.sweep_pending(pending, 7.0) == [str(placeholder)]
+
+
+def test_sweep_pending_sorts_empty_files(tmp_path: Path) -> None:
+    """A settled file with no partial sibling is sorted even if it is empty."""
+    empty = tmp_path / "notes.txt"
+    empty.write_bytes(b"")
+    pending: dict[str, tray.PendingFile] = {}
+    tray.record_event(FileClosedEvent(str(empty)), pending, 0.0)
+
+    assert tray.sweep_pending(pending, tray.CLOSED_QUIET_SECONDS) == [str(empty)]
+    assert pending == {}
+
+
+def test_record_event_tracks_files_renamed_into_place(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A finished ``.part`` renamed to its real name becomes pending.
+
+    This holds even where close events are relied on, since no close follows
+    the rename.
+    """
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", True)
+    monkeypatch.setattr(tray, "DOWNLOADS_FOLDER_PATH", "/dl")
+    monkeypatch.setattr(tray, "should_skip_by_extension", lambda n: n.endswith(".part"))
+    pending: dict[str, tray.PendingFile] = {
+        "/dl/a.pdf.part": tray.PendingFile(last_event=0.0, writing=True)
+    }
+
+    moved = FileMovedEvent("/dl/a.pdf.part", "/dl/a.pdf")
+    tray.record_event(moved, pending, 1.0)
+    assert pending == {"/dl/a.pdf": tray.PendingFile(last_event=1.0)}
+
+    away = FileMovedEvent("/dl/a.pdf", "/dl/keep/a.pdf")
+    tray.record_event(away, pending, 2.0)
+    assert pending == {}
+
+
+def test_record_event_tracks_created_files_on_linux(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A file moved in from another folder is tracked from its created event.
+
+    inotify reports such a move as a bare create with no close afterwards,
+    so it must become pending even where close events are relied on.
+    """
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", True)
+    pending: dict[str, tray.PendingFile] = {}
+
+    tray.record_event(FileCreatedEvent("/dl/a.pdf"), pending, 1.0)
+    assert pending == {"/dl/a.pdf": tray.PendingFile(last_event=1.0)}
+
+
+def test_sweep_pending_waits_for_close_of_written_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """On Linux a file that was written to stays pending until it is closed.
+
+    Once its events have stopped for ``CLOSE_WAIT_SECONDS`` the quiet-period
+    rule alone decides again.
+    """
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", True)
+    part = tmp_path / "slow.zip"
+    part.write_bytes(b"data")
+    st = part.stat()
+    pending: dict[str, tray.PendingFile] = {
+        str(part): tray.PendingFile(st.st_size, st.st_mtime_ns, 0.0, writing=True)
+    }
+
+    assert tray.sweep_pending(pending, tray.STABLE_SECONDS + 5) == []
+    assert list(pending) == [str(part)]
+
+    assert tray.sweep_pending(pending, tray.CLOSE_WAIT_SECONDS) == [str(part)]
+
+
+def test_sweep_pending_ignores_metadata_changes_after_close(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A modified event that only touched metadata does not wait for a close.
+
+    Tools such as ``cp -p`` and wget close the file and then set its
+    attributes or restore an older mtime, and no close follows that.
+    """
+    monkeypatch.setattr(tray, "CLOSE_EVENTS_SUPPORTED", True)
+    done = tmp_path / "a.pdf"
+    pending: dict[str, tray.PendingFile] = {}
+
+    tray.record_event(FileCreatedEvent(str(done)), pending, 0.0)
+    done.write_bytes(b"data")
+    tray.record_event(FileModifiedEvent(str(done)), pending, 0.0)
+    tray.record_event(FileClosedEvent(str(done)), pending, 0.0)
+    done.chmod(0o600)
+    os.utime(done, ns=(0, done.stat().st_mtime_ns - 10**9))
+    tray.record_event(FileModifiedEvent(str(done)), pending, 1.0)
+    assert pending[str(done)].writing
+
+    assert tray.sweep_pending(pending, 1.0 + tray.STABLE_SECONDS) == []
+    assert tray.sweep_pending(pending, 2.0 + tray.STABLE_SECONDS) == [str(done)]
+
+
+def test_event_handler_filters_skip_listed_files(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Partial downloads and directories never reach the sweeper queue."""
+    monkeypatch.setattr(tray, "SKIP_EXTENSIONS", frozenset({".crdownload"}))
+    queued: list[str] = []
+    monkeypatch.setattr(tray._event_q, "put", lambda e: queued.append(e.src_path))
+
+    handler = tray.MyEventHandler()
+    handler.dispatch(FileCreatedEvent("/dl/a.CRDOWNLOAD"))
+    handler.dispatch(DirModifiedEvent("/dl"))
+    handler.dispatch(FileCreatedEvent("/dl/b.pdf"))
+
+    assert queued == ["/dl/b.pdf"]
+
+
+def test_sweep_pending_waits_for_a_stable_signature(tmp_path: Path) -> None:
+    """A file is ready once two sweeps agree on its size and mtime.
+
+    Both sweeps must come after the quiet period; files that disappeared are
+    dropped.
+    """
+    done = tmp_path / "done.pdf"
+    done.write_bytes(b"data")
+    gone = str(tmp_path / "gone.pdf")
+    pending: dict[str, tray.PendingFile] = {
+        str(done): tray.PendingFile(last_event=0.0),
+        gone: tray.PendingFile(last_event=0.0),
+    }
+
+    assert tray.sweep_pending(pending, tray.STABLE_SECONDS) == []
+    assert list(pending) == [str(done)]
+
+    assert tray.sweep_pending(pending, tray.STABLE_SECONDS + 1) == [str(done)]
+    assert pending == {}
+
+
+def test_refresh_menu_only_updates_on_state_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Repeated start or stop clicks do not rebuild the tray menu."""
+    updates: list[bool] = []
+
+    class FakeIcon:
+        def update_menu(self) -> None:
+            updates.append(tray.is_watching())
+
+    icon = FakeIcon()
+    monkeypatch.setattr(tray, "_menu_watching", False)
+    monkeypatch.setattr(tray, "_watch", None)
+    tray.refresh_menu(icon)
+    monkeypatch.setattr(tray, "_watch", object())
+    tray.refresh_menu(icon)
+    tray.refresh_menu(icon)
+    monkeypatch.setattr(tray, "_watch", None)
+    tray.refresh_menu(icon)
+
+    assert updates == [True, False]
+
+
+def test_sort_ready_paths_sends_media_to_prompt_executor(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Files needing the meme prompt do not hold up the rest of the batch."""
+    sorted_inline: list[str] = []
+    prompted: list[str] = []
+
+    class FakeExecutor:
+        def submit(self, fn: Any, path: str) -> None:
+            prompted.append(path)
+
+    monkeypatch.setattr(tray, "needs_meme_prompt", lambda p: p.endswith(".jpg"))
+    monkeypatch.setattr(tray, "_prompt_executor", FakeExecutor())
+    monkeypatch.setattr(
+        tray, "sort_file", lambda p, wait_for_download: sorted_inline.append(p)
+    )
+
+    tray.sort_ready_paths(["/dl/a.jpg", "/dl/b.pdf", "/dl/b.pdf"])
+
+    assert prompted == ["/dl/a.jpg"]
+    assert sorted_inline == ["/dl/b.pdf"]
+
+
+def test_quit_action_waits_for_sorting_before_stopping_logging(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every worker pool is drained before the log listener is stopped."""
+    calls: list[str] = []
+
+    class FakeExecutor:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+        def shutdown(self, wait: bool = True) -> None:
+            calls.append(f"{self.name} wait={wait}")
+
+    class FakeIcon:
+        def stop(self) -> None:
+            calls.append("icon")
+
+    monkeypatch.setattr(tray, "stop_watching", lambda: calls.append("watch"))
+    monkeypatch.setattr(tray, "shutdown_observer", lambda: calls.append("observer"))
+    for name in ("_executor", "_prompt_executor", "_move_pool"):
+        monkeypatch.setattr(tray, name, FakeExecutor(name))
+    monkeypatch.setattr(tray, "stop_logging", lambda: calls.append("logging"))
+
+    tray.quit_action(FakeIcon())
+
+    assert calls == [
+        "watch",
+        "observer",
+        "_executor wait=True",
+        "_prompt_executor wait=True",
+        "_move_pool wait=True",
+        "logging",
+        "icon",
+    ]
+
+
+def test_sweep_pending_keeps_locked_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A settled file still held open by its writer stays pending."""
+    done = tmp_path / "done.pdf"
+    done.write_bytes(b"data")
+    st = done.stat()
+    pending: dict[str, tray.PendingFile] = {
+        str(done): tray.PendingFile(st.st_size, st.st_mtime_ns, 0.0)
+    }
+
+    monkeypatch.setattr(tray, "is_locked", lambda p: True)
+    assert tray.sweep_pending(pending, tray.STABLE_SECONDS) == []
+    monkeypatch.setattr(tray, "is_locked", lambda p: False)
+    assert tray.sweep_pending(pending, tray.STABLE_SECONDS) == [str(done)]